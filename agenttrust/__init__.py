@@ -4,6 +4,10 @@ __version__ = "0.1.0"
 
 from agenttrust.core.calibration import (
     sample_consistency,
+    sample_consistency_async,
+    sample_consistency_batch,
+    sample_consistency_iter,
+    sample_consistency_streaming,
     source_signal_confidence,
     report_confidence,
     verbalized_confidence,
@@ -13,6 +17,10 @@ from agenttrust.core.beipackzettel import Beipackzettel
 
 __all__ = [
     "sample_consistency",
+    "sample_consistency_async",
+    "sample_consistency_batch",
+    "sample_consistency_iter",
+    "sample_consistency_streaming",
     "source_signal_confidence",
     "report_confidence",
     "verbalized_confidence",
@@ -14,7 +14,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Beipackzettel:
     """Mandatory metadata attached to every agent output.
 
@@ -75,9 +75,11 @@ class Beipackzettel:
             'high' if confidence <50 or ≥3 risks.
             'medium' otherwise.
         """
-        if self.confidence < 50 or len(self.risks) >= 3:
+        confidence = self.confidence
+        risks = self.risks
+        if confidence < 50 or len(risks) >= 3:
             return "high"
-        elif self.confidence >= 80 and len(self.risks) == 0:
+        elif confidence >= 80 and not risks:
             return "low"
         else:
             return "medium"
@@ -88,9 +90,13 @@ class Beipackzettel:
         return len(self.uncertainties) > 0 or len(self.not_checked) > 0
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize to a plain dict for JSON/logging."""
+        """Serialize to a plain dict for JSON/logging.
+
+        ``confidence`` is rounded to one decimal; the attribute itself keeps
+        full precision for further computation.
+        """
         return {
-            "confidence": self.confidence,
+            "confidence": round(self.confidence, 1),
             "sources": self.sources,
             "uncertainties": self.uncertainties,
             "risks": self.risks,
@@ -98,7 +104,7 @@ class Beipackzettel:
             "model": self.model,
             "agent_id": self.agent_id,
             "risk_level": self.risk_level,
-            "is_grounded": self.is_grounded,
+            "is_grounded": bool(self.sources),
             **self.metadata,
         }
 
@@ -12,23 +12,42 @@ See also: PMC/12249208 — LLMs are overconfident 84% of the time.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import re
-import statistics
-from collections import Counter
-from dataclasses import dataclass, field
+import unicodedata
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Sequence
+from operator import itemgetter, mul
+from typing import Awaitable, Callable, Iterable, Iterator, Sequence
 
+try:
+    import re2 as _regex  # optional: pip install agenttrust[re2]
+except ImportError:
+    _regex = re
 
-class ConfidenceLevel(Enum):
-    """Discrete confidence levels derived from sample consistency."""
+
+class ConfidenceLevel(str, Enum):
+    """Discrete confidence levels derived from sample consistency.
+
+    A ``str`` subclass, so levels serialize directly to JSON as their value.
+    ``str()`` and f-strings also render the value on every Python version
+    (3.11 changed the default for mixed-in enums to ``ConfidenceLevel.HIGH``).
+    """
 
     HIGH = "high"       # 3/3 agree — >85% confidence
     MEDIUM = "medium"   # 2/3 agree — 60-85% confidence
     LOW = "low"         # ≤1/3 agree — <60% confidence
 
+    def __str__(self) -> str:
+        return self.value
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.value, format_spec)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CalibrationResult:
     """Result of a Budget-CoCoA consistency check.
 
@@ -37,8 +56,12 @@ class CalibrationResult:
         samples: The raw responses from each independent sample.
         agreement_ratio: Fraction of samples that match the majority answer.
         confidence_level: Discrete confidence level (HIGH/MEDIUM/LOW).
-        confidence_pct: Numeric confidence estimate (0-100).
+        confidence_pct: Numeric confidence estimate (0-100), unrounded.
         majority_answer: The most common normalized answer, or None if no majority.
+        normalized_samples: The samples after ``_normalize``, in the same order
+            as ``samples``. Reuse these instead of re-normalizing downstream.
+        partial: True for intermediate results from ``sample_consistency_iter``
+            that more samples may still change.
     """
 
     query: str
@@ -47,34 +70,64 @@ class CalibrationResult:
     confidence_level: ConfidenceLevel
     confidence_pct: float
     majority_answer: str | None
+    normalized_samples: tuple[str, ...] = ()
+    partial: bool = False
+
 
+_TRAILING_PUNCT = ".!?,;:"
 
+
+@functools.lru_cache(maxsize=1024)
 def _normalize(text: str) -> str:
     """Normalize a response for comparison.
 
-    Strips whitespace, lowercases, and removes trailing punctuation so that
+    Applies NFKC (fullwidth forms, ligatures, compatibility characters),
+    strips whitespace, case-folds, and removes trailing punctuation so that
     minor formatting differences don't break agreement detection.
+
+    Memoized: consistency samples repeat verbatim by design, so identical
+    answers are only normalized once.
     """
-    text = text.strip().lower()
-    text = re.sub(r"[.!?,;:]+$", "", text)
-    # Collapse whitespace
-    text = re.sub(r"\s+", " ", text)
-    return text
+    if not text.isascii():
+        # ASCII is NFKC-invariant; only non-ASCII answers need the table walk
+        text = unicodedata.normalize("NFKC", text).casefold()
+    elif not text.islower():
+        # Already-lowercase ASCII is its own case fold; skip the copy
+        text = text.casefold()
+    # split()/join() strips the ends and collapses whitespace runs in one pass
+    return " ".join(text.split()).rstrip(_TRAILING_PUNCT)
 
 
-def _compute_agreement(samples: Sequence[str]) -> tuple[float, str | None]:
-    """Compute agreement ratio and majority answer from normalized samples.
+def _compute_agreement(
+    samples: Sequence[str],
+) -> tuple[int, str | None, tuple[str, ...]]:
+    """Count agreement and find the majority answer from normalized samples.
 
     Returns:
-        Tuple of (agreement_ratio, majority_answer). majority_answer is None
-        if all answers are different.
+        Tuple of (agreeing_count, majority_answer, normalized_samples), where
+        agreeing_count is how many samples match the most common answer.
+        majority_answer is None if all answers are different.
     """
-    normalized = [_normalize(s) for s in samples]
-    counts = Counter(normalized)
-    most_common, most_count = counts.most_common(1)[0]
-    ratio = most_count / len(normalized)
+    normalized = tuple(map(_normalize, samples))
+
+    if len(normalized) == 3:
+        # Fast path for the default Budget-CoCoA sample size
+        a, b, c = normalized
+        if a == b == c:
+            return 3, a, normalized
+        if a == b or a == c:
+            return 2, a, normalized
+        if b == c:
+            return 2, b, normalized
+        return 1, None, normalized
+
+    counts: dict[str, int] = {}
+    for key in normalized:
+        counts[key] = counts.get(key, 0) + 1
+    # max() keeps the first-seen answer on ties, like Counter.most_common
+    most_common, most_count = max(counts.items(), key=itemgetter(1))
     majority = most_common if most_count > 1 or len(normalized) == 1 else None
-    return ratio, majority
+    return most_count, majority, normalized
 
 
 def _ratio_to_level(ratio: float, n: int) -> ConfidenceLevel:
@@ -98,32 +151,62 @@ def _ratio_to_pct(ratio: float) -> float:
 
     Linear mapping: 0.0 → 30%, 0.5 → 57.5%, 1.0 → 85%.
     Capped at [30, 95] — we never say 100% and never below 30%.
+    Not rounded; format at presentation time.
     """
     pct = 30.0 + ratio * 55.0
-    return min(95.0, max(30.0, round(pct, 1)))
+    return min(95.0, max(30.0, pct))
+
+
+# (n, agreeing samples) → (agreement ratio, level, pct) for common sample sizes
+_LEVEL_TABLE: dict[tuple[int, int], tuple[float, ConfidenceLevel, float]] = {
+    (n, k): (k / n, _ratio_to_level(k / n, n), _ratio_to_pct(k / n))
+    for n in range(2, 11)
+    for k in range(1, n + 1)
+}
 
 
 def sample_consistency(
     fn: Callable[[str], str],
     query: str,
     n: int = 3,
+    *,
+    executor: Executor | None = None,
+    batch_fn: Callable[[str, int], Sequence[str]] | None = None,
+    parallel: bool = True,
 ) -> CalibrationResult:
     """Run Budget-CoCoA: ask the same question n times and measure consistency.
 
     This is the core calibration primitive. Pass any function that takes a
     query string and returns an answer string. We call it ``n`` times
-    independently, then measure how much the answers agree.
+    independently and concurrently, then measure how much the answers agree.
 
     Args:
         fn: A callable that takes a query string and returns an answer.
             Each call should be independent (e.g., no conversation history).
+            Calls run concurrently on worker threads, so ``fn`` must be
+            thread-safe unless ``parallel=False``.
         query: The claim or question to check.
         n: Number of independent samples (default 3). Higher = more accurate
            but more expensive. 3 is the "budget" sweet spot.
+        executor: Optional executor to run the samples on. Pass a shared pool
+            to avoid spinning up threads on every call. Default: a
+            short-lived ``ThreadPoolExecutor`` with ``n`` workers.
+        batch_fn: Optional callable ``(query, n) -> list of n answers`` for
+            providers that sample several completions in one request (e.g.
+            OpenAI's ``n=`` parameter). When given, it is called once
+            instead of calling ``fn`` ``n`` times.
+        parallel: Run the ``n`` calls concurrently (default True). Set to
+            False to call ``fn`` sequentially on the calling thread, e.g.
+            for functions that are not thread-safe or that replay answers
+            from an iterator in a fixed order. ``executor`` is then ignored.
 
     Returns:
         CalibrationResult with agreement ratio, confidence level, and samples.
 
+    Raises:
+        ValueError: If ``n < 2`` or ``batch_fn`` returns the wrong number
+            of samples.
+
     Example::
 
         >>> def fake_llm(q: str) -> str:
@@ -137,26 +220,231 @@ def sample_consistency(
     if n < 2:
         raise ValueError("Need at least 2 samples for consistency check")
 
+    if batch_fn is not None:
+        samples = list(batch_fn(query, n))
+        if len(samples) != n:
+            raise ValueError(f"batch_fn returned {len(samples)} samples, expected {n}")
+    elif not parallel:
+        samples = [fn(query) for _ in range(n)]
+    elif executor is None:
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            samples = list(pool.map(fn, [query] * n))
+    else:
+        samples = list(executor.map(fn, [query] * n))
+
+    return _build_result(query, samples)
+
+
+async def sample_consistency_async(
+    fn: Callable[[str], Awaitable[str]],
+    query: str,
+    n: int = 3,
+) -> CalibrationResult:
+    """Async Budget-CoCoA: like ``sample_consistency`` for coroutine functions.
+
+    All ``n`` calls are awaited concurrently with ``asyncio.gather``, so
+    wall time is roughly one call's latency. Use this with async LLM
+    clients (``AsyncOpenAI``, ``AsyncAnthropic``) instead of a thread pool.
+
+    Args:
+        fn: An async callable that takes a query string and returns an answer.
+            Each call should be independent (e.g., no conversation history).
+        query: The claim or question to check.
+        n: Number of independent samples (default 3).
+
+    Returns:
+        CalibrationResult with agreement ratio, confidence level, and samples.
+    """
+    if n < 2:
+        raise ValueError("Need at least 2 samples for consistency check")
+
+    samples = await asyncio.gather(*(fn(query) for _ in range(n)))
+    return _build_result(query, samples)
+
+
+def sample_consistency_streaming(
+    fn: Callable[[str], str],
+    query: str,
+    n: int = 3,
+) -> CalibrationResult:
+    """Budget-CoCoA that stops sampling once the majority answer is locked in.
+
+    Calls ``fn`` sequentially and stops as soon as one answer holds a strict
+    majority of all ``n`` planned samples, since the remaining samples can
+    no longer change the majority. For n=3 two matching answers end the
+    check after two calls.
+
+    The agreement ratio is conservative: samples that were never drawn
+    count as disagreeing, so it is ``leader_count / n``. An early stop at
+    n=3 therefore reports MEDIUM, never HIGH. Use ``sample_consistency``
+    when the distinction between HIGH and MEDIUM matters more than cost.
+
+    Args:
+        fn: A callable that takes a query string and returns an answer.
+            Each call should be independent (e.g., no conversation history).
+        query: The claim or question to check.
+        n: Maximum number of independent samples (default 3).
+
+    Returns:
+        CalibrationResult over the samples actually drawn.
+    """
+    for result in sample_consistency_iter(fn, query, n, early_stop=True):
+        pass
+    return result
+
+
+def sample_consistency_iter(
+    fn: Callable[[str], str],
+    query: str,
+    n: int = 3,
+    *,
+    early_stop: bool = False,
+) -> Iterator[CalibrationResult]:
+    """Budget-CoCoA that yields a running result after every sample.
+
+    Samples are drawn sequentially. Each intermediate result has
+    ``partial=True`` and scores the samples so far against all ``n``
+    planned samples (undrawn samples count as disagreeing), so its
+    confidence can only rise as sampling continues. Interactive agents
+    can act on it or stop iterating once it is good enough.
+
+    Args:
+        fn: A callable that takes a query string and returns an answer.
+            Each call should be independent (e.g., no conversation history).
+        query: The claim or question to check.
+        n: Maximum number of independent samples (default 3).
+        early_stop: Stop as soon as one answer holds a strict majority of
+            ``n``, as ``sample_consistency_streaming`` does.
+
+    Yields:
+        One CalibrationResult per sample drawn. The last one is final
+        (``partial=False``).
+
+    Example::
+
+        >>> def fake_llm(q: str) -> str:
+        ...     return "Paris"
+        >>> for result in sample_consistency_iter(fake_llm, "Capital of France?"):
+        ...     print(len(result.samples), result.confidence_level.value, result.partial)
+        1 low True
+        2 medium True
+        3 high False
+    """
+    if n < 2:
+        raise ValueError("Need at least 2 samples for consistency check")
+
+    # Running tally, so each step is scored without recounting earlier
+    # samples. Ties go to the first-seen answer, as in _compute_agreement.
     samples: list[str] = []
-    for _ in range(n):
-        response = fn(query)
-        samples.append(response)
+    normalized: list[str] = []
+    counts: dict[str, int] = {}
+    first_seen: dict[str, int] = {}
+    leader_key = ""
+    leader = 0
+    for drawn in range(1, n + 1):
+        answer = fn(query)
+        samples.append(answer)
+        key = _normalize(answer)
+        normalized.append(key)
+        first_seen.setdefault(key, drawn)
+        count = counts[key] = counts.get(key, 0) + 1
+        if count > leader or (
+            count == leader and first_seen[key] < first_seen[leader_key]
+        ):
+            leader, leader_key = count, key
+        majority = leader_key if leader > 1 or drawn == 1 else None
+        done = drawn == n or (early_stop and _majority_locked(leader, n))
+        yield _build_result(
+            query, samples, n, partial=not done,
+            tally=(leader, majority, tuple(normalized)),
+        )
+        if done:
+            return
+
+
+def sample_consistency_batch(
+    items: Iterable[tuple[str, Sequence[str]]],
+) -> list[CalibrationResult]:
+    """Score samples that were already collected, e.g. from a batch API job.
+
+    Runs the same scoring as ``sample_consistency`` without calling a model.
+    Normalization is cached across the whole batch, so answers that repeat
+    between queries are only normalized once.
+
+    Args:
+        items: ``(query, samples)`` pairs, each with at least 2 samples.
+
+    Returns:
+        One CalibrationResult per pair, in input order.
+
+    Example::
+
+        >>> results = sample_consistency_batch([
+        ...     ("capital of France?", ["Paris", "Paris", "paris"]),
+        ...     ("capital of Spain?", ["Madrid", "Madrid", "Barcelona"]),
+        ... ])
+        >>> [r.confidence_level.value for r in results]
+        ['high', 'medium']
+    """
+    results = []
+    for query, samples in items:
+        if len(samples) < 2:
+            raise ValueError(
+                f"Need at least 2 samples for consistency check, "
+                f"got {len(samples)} for {query!r}"
+            )
+        results.append(_build_result(query, samples))
+    return results
+
+
+def _majority_locked(leader: int, total: int) -> bool:
+    """Whether ``leader`` matching answers are a strict majority of ``total``.
+
+    A strict majority of the planned total can't be overtaken by undrawn
+    samples: every other answer is capped at ``total - leader < leader``.
+    """
+    return leader * 2 > total
+
+
+def _build_result(
+    query: str,
+    samples: Sequence[str],
+    n: int | None = None,
+    partial: bool = False,
+    tally: tuple[int, str | None, tuple[str, ...]] | None = None,
+) -> CalibrationResult:
+    """Score collected samples and package them as a CalibrationResult.
 
-    ratio, majority = _compute_agreement(samples)
-    level = _ratio_to_level(ratio, n)
-    pct = _ratio_to_pct(ratio)
+    ``n`` is the planned sample count when fewer samples were drawn; the
+    agreement ratio is then taken over ``n`` (undrawn samples disagree).
+    ``tally`` is a precomputed ``_compute_agreement(samples)`` result, for
+    callers that already keep a running count.
+    """
+    if tally is None:
+        tally = _compute_agreement(samples)
+    agreeing, majority, normalized = tally
+    total = n or len(samples)
+    cached = _LEVEL_TABLE.get((total, agreeing))
+    if cached is not None:
+        ratio, level, pct = cached
+    else:
+        ratio = agreeing / total
+        level = _ratio_to_level(ratio, total)
+        pct = _ratio_to_pct(ratio)
 
     return CalibrationResult(
         query=query,
         samples=tuple(samples),
-        agreement_ratio=round(ratio, 4),
+        agreement_ratio=ratio,
         confidence_level=level,
         confidence_pct=pct,
         majority_answer=majority,
+        normalized_samples=normalized,
+        partial=partial,
     )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VerbalizedConfidenceResult:
     """Result of parsing an LLM's self-reported confidence.
 
@@ -165,7 +453,7 @@ class VerbalizedConfidenceResult:
         stated_confidence: The confidence percentage the LLM claimed (0-100).
         calibrated_confidence: Adjusted confidence after applying overconfidence
             discount. LLMs are overconfident ~84% of the time, so we apply a
-            discount factor.
+            discount factor. Unrounded.
         discount_factor: The multiplier applied (default 0.7).
     """
 
@@ -175,13 +463,21 @@ class VerbalizedConfidenceResult:
     discount_factor: float
 
 
-_CONFIDENCE_PATTERN = re.compile(
-    r"(?:confidence|confident|certainty|sure)[\s:]*(\d{1,3})[\s]*%",
-    re.IGNORECASE,
+# One alternation covers both phrasings, so the text is scanned once:
+#   keyword first: "confidence: 85%", "certainty 60%"  → group 1
+#   number first:  "90% confident", "75 % sure"        → group 2
+# Matched against lowercased text, so no case-insensitive flag is needed.
+# Compiled with RE2 when available (linear time on untrusted LLM output),
+# so the pattern sticks to the RE2-compatible subset (no lookbehind).
+_CONFIDENCE_PATTERN = _regex.compile(
+    r"(?:confidence|confident|certainty|sure)[\s:]*(\d{1,3}(?:\.\d+)?)\s*%"
+    r"|\b(\d{1,3}(?:\.\d+)?)\s*%\s*(?:confident|certain|sure)"
 )
+# Every _CONFIDENCE_PATTERN match contains one of these substrings
+_CONFIDENCE_KEYWORDS = ("confiden", "certain", "sure")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceSignalResult:
     """Result of the 3-signal confidence formula.
 
@@ -196,7 +492,7 @@ class SourceSignalResult:
         source_signal: Quality of the source (0-1).
         consistency_signal: Agreement/verification level (0-1).
         structural_signal: Deterministic text features (0-1).
-        confidence_pct: Final computed confidence (0-100).
+        confidence_pct: Final computed confidence (0-100), unrounded.
         admiralty: Admiralty rating used (e.g., "A1", "C3").
     """
 
@@ -230,6 +526,27 @@ _CONSISTENCY_MAP: dict[str, float] = {
     "unverifiable": 0.30,
 }
 
+# Recency discount by evidence age in years: -10%/year, floored at 0.5.
+# The floor is reached at 5 years, so the last entry covers all older evidence.
+_RECENCY: tuple[float, ...] = tuple(max(0.5, 1.0 - age * 0.1) for age in range(16))
+
+# Structural marker weights, in flag-bit order: DOI, URL, percentage, year,
+# source reference. _STRUCTURAL_TABLE holds the capped sum for every bitmask.
+_STRUCTURAL_WEIGHTS: tuple[float, ...] = (0.30, 0.15, 0.10, 0.05, 0.10)
+
+
+def _structural_score(flags: int) -> float:
+    score = 0.0
+    for bit, weight in enumerate(_STRUCTURAL_WEIGHTS):
+        if flags >> bit & 1:
+            score += weight
+    return min(0.50, score)
+
+
+_STRUCTURAL_TABLE: tuple[float, ...] = tuple(
+    _structural_score(flags) for flags in range(1 << len(_STRUCTURAL_WEIGHTS))
+)
+
 
 def source_signal_confidence(
     claim: str,
@@ -277,14 +594,55 @@ def source_signal_confidence(
         ...     "ECE averages 27.3%", admiralty="A1",
         ...     verification="verified", has_doi=True, has_percentage=True
         ... )
-        >>> r.confidence_pct
-        82.5
+        >>> round(r.confidence_pct, 1)
+        71.5
+    """
+    # bool() so any truthy marker (e.g. an re.Match) sets exactly one bit
+    flags = (
+        bool(has_doi)
+        | bool(has_url) << 1
+        | bool(has_percentage) << 2
+        | bool(has_year) << 3
+        | bool(has_source_ref) << 4
+    )
+    source, consistency, structural, conf_pct = _compute_signals(
+        admiralty, verification, evidence_year, current_year, flags
+    )
+
+    return SourceSignalResult(
+        claim=claim,
+        source_signal=source,
+        consistency_signal=consistency,
+        structural_signal=structural,
+        confidence_pct=conf_pct,
+        admiralty=admiralty,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_signals(
+    admiralty: str,
+    verification: str,
+    evidence_year: int | None,
+    current_year: int,
+    flags: int,
+) -> tuple[float, float, float, float]:
+    """Compute the (source, consistency, structural, confidence_pct) signals.
+
+    Pure function of its arguments, so results are memoized. The five
+    structural markers are packed into ``flags`` (bit 0 = DOI, 1 = URL,
+    2 = percentage, 3 = year, 4 = source reference) to keep the cache key small.
     """
     # Source signal
     adm_score = _ADMIRALTY_SCORES.get(admiralty, 0.40)
     ver_score = _VERIFICATION_SCORES.get(verification, 0.5)
     if evidence_year is not None:
-        recency = max(0.5, 1.0 - (current_year - evidence_year) * 0.1)
+        age = current_year - evidence_year
+        if isinstance(age, int) and age >= 0:
+            recency = _RECENCY[min(age, len(_RECENCY) - 1)]
+        else:
+            # Fractional years, or evidence dated after current_year
+            recency = max(0.5, 1.0 - age * 0.1)
     else:
         recency = 0.8  # default if unknown
     source = adm_score * ver_score * recency
@@ -293,31 +651,12 @@ def source_signal_confidence(
     consistency = _CONSISTENCY_MAP.get(verification, 0.40)
 
     # Structural signal (deterministic text markers)
-    structural = 0.0
-    if has_doi:
-        structural += 0.30
-    if has_url:
-        structural += 0.15
-    if has_percentage:
-        structural += 0.10
-    if has_year:
-        structural += 0.05
-    if has_source_ref:
-        structural += 0.10
-    structural = min(0.50, structural)
+    structural = _STRUCTURAL_TABLE[flags]
 
     # Combined confidence
     conf = 0.5 * source + 0.3 * consistency + 0.2 * structural
-    conf_pct = round(conf * 100, 1)
 
-    return SourceSignalResult(
-        claim=claim,
-        source_signal=round(source, 4),
-        consistency_signal=round(consistency, 4),
-        structural_signal=round(structural, 4),
-        confidence_pct=conf_pct,
-        admiralty=admiralty,
-    )
+    return source, consistency, structural, conf * 100
 
 
 def report_confidence(
@@ -343,7 +682,7 @@ def report_confidence(
         ...     source_signal_confidence("Claim 2", admiralty="C3", verification="partial"),
         ... ]
         >>> report_confidence(claims, weights=[1.0, 0.6])
-        68.3
+        53.2
     """
     if not claim_results:
         return 0.0
@@ -356,9 +695,8 @@ def report_confidence(
     if total_weight == 0:
         return 0.0
 
-    weighted_sum = sum(
-        r.confidence_pct * w for r, w in zip(claim_results, weights)
-    )
+    confidences = [r.confidence_pct for r in claim_results]
+    weighted_sum = sum(map(mul, confidences, weights))
     return round(weighted_sum / total_weight, 1)
 
 
@@ -392,22 +730,27 @@ def verbalized_confidence(
         >>> result = verbalized_confidence("I'm 90% confident this is correct.")
         >>> result.stated_confidence
         90.0
-        >>> result.calibrated_confidence
+        >>> round(result.calibrated_confidence, 1)
         63.0
     """
     if not 0 < discount <= 1.0:
         raise ValueError(f"Discount must be in (0, 1], got {discount}")
 
-    match = _CONFIDENCE_PATTERN.search(text)
+    # Cheap substring pre-filters: skip the regex when no match is possible
+    match = None
+    if "%" in text:
+        lowered = text.lower()
+        if any(k in lowered for k in _CONFIDENCE_KEYWORDS):
+            match = _CONFIDENCE_PATTERN.search(lowered)
     if not match:
         raise ValueError(
             f"No confidence statement found in text. "
             f"Expected patterns like 'confidence: 85%' or '90% confident'."
         )
 
-    stated = float(match.group(1))
+    stated = float(match.group(1) or match.group(2))
     stated = min(100.0, max(0.0, stated))
-    calibrated = round(stated * discount, 1)
+    calibrated = stated * discount
 
     return VerbalizedConfidenceResult(
         raw_text=text,
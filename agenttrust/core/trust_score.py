@@ -20,9 +20,10 @@ Trust levels:
 from __future__ import annotations
 
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Literal
+from typing import Iterable, Literal
 
 
 class TrustLevel(Enum):
@@ -34,7 +35,7 @@ class TrustLevel(Enum):
     AUTONOMOUS = "autonomous"     # 81+: direct delivery
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrustEvent:
     """A single trust-relevant event in an agent's history.
 
@@ -53,6 +54,62 @@ class TrustEvent:
     reason: str
 
 
+# (outcome, high_confidence) → (score delta, default reason, is_template).
+# Only "bad" outcomes depend on confidence; all others use high=False.
+# Reasons with is_template=False are used verbatim, without str.format.
+_DELTA_TABLE: dict[tuple[str, bool], tuple[int, str, bool]] = {
+    ("good", False): (1, "Good output (stated {c:.0f}%)", True),
+    ("bad", True): (-3, "Bad output with high confidence ({c:.0f}%) — overconfident", True),
+    ("bad", False): (-1, "Bad output with low confidence ({c:.0f}%) — at least honest", True),
+    ("flagged_real", False): (2, "Flagged uncertainty that was confirmed real", False),
+    ("hidden_problem", False): (-3, "QA found a problem the agent didn't flag", False),
+}
+
+
+# Fraction of outputs QA reviews at each trust level
+_QA_RATES: dict[TrustLevel, float] = {
+    TrustLevel.UNTRUSTED: 1.0,
+    TrustLevel.SUPERVISED: 0.5,
+    TrustLevel.SPOT_CHECK: 0.2,
+    TrustLevel.AUTONOMOUS: 0.0,
+}
+
+# (highest score in band, trust level), in ascending order
+_BANDS: tuple[tuple[float, TrustLevel], ...] = (
+    (30, TrustLevel.UNTRUSTED),
+    (60, TrustLevel.SUPERVISED),
+    (80, TrustLevel.SPOT_CHECK),
+    (float("inf"), TrustLevel.AUTONOMOUS),
+)
+
+
+def _make_event(
+    stated_confidence: float,
+    outcome: Literal["good", "bad", "flagged_real", "hidden_problem"],
+    reason: str,
+    timestamp: float | None,
+) -> TrustEvent:
+    """Apply the scoring rules to build a TrustEvent (score not touched)."""
+    high = stated_confidence >= 80 if outcome == "bad" else False
+    entry = _DELTA_TABLE.get((outcome, high))
+    if entry is None:
+        raise ValueError(f"Unknown outcome: {outcome!r}")
+    delta, default_reason, is_template = entry
+    if not reason:
+        if is_template:
+            reason = default_reason.format(c=stated_confidence)
+        else:
+            reason = default_reason
+
+    return TrustEvent(
+        timestamp=timestamp or time.time(),
+        stated_confidence=stated_confidence,
+        outcome=outcome,
+        delta=delta,
+        reason=reason,
+    )
+
+
 class TrustScore:
     """Tracks an agent's trust score over time.
 
@@ -65,6 +122,11 @@ class TrustScore:
         initial_score: Starting score (default 0).
         min_score: Floor for the score (default 0).
         max_score: Ceiling for the score (default 100).
+        history_limit: Maximum number of events kept in ``history``; older
+            events are dropped first (default 10000). ``None`` keeps all.
+
+    Raises:
+        ValueError: If ``history_limit`` is less than 1.
 
     Example::
 
@@ -79,18 +141,36 @@ class TrustScore:
         3
     """
 
+    __slots__ = (
+        "agent_id",
+        "_score",
+        "_min",
+        "_max",
+        "_history",
+        "_history_snapshot",
+        "_total_events",
+        "_level",
+        "_qa_rate",
+    )
+
     def __init__(
         self,
         agent_id: str,
         initial_score: int = 0,
         min_score: int = 0,
         max_score: int = 100,
+        history_limit: int | None = 10000,
     ) -> None:
+        if history_limit is not None and history_limit < 1:
+            raise ValueError(f"history_limit must be at least 1, got {history_limit}")
         self.agent_id = agent_id
         self._score = initial_score
         self._min = min_score
         self._max = max_score
-        self._history: list[TrustEvent] = []
+        self._history: deque[TrustEvent] = deque(maxlen=history_limit)
+        self._history_snapshot: tuple[TrustEvent, ...] | None = None
+        self._total_events = 0
+        self._recompute_level()
 
     @property
     def score(self) -> int:
@@ -100,19 +180,26 @@ class TrustScore:
     @property
     def trust_level(self) -> TrustLevel:
         """Current autonomy level based on score."""
-        if self._score <= 30:
-            return TrustLevel.UNTRUSTED
-        elif self._score <= 60:
-            return TrustLevel.SUPERVISED
-        elif self._score <= 80:
-            return TrustLevel.SPOT_CHECK
-        else:
-            return TrustLevel.AUTONOMOUS
+        return self._level
+
+    def _recompute_level(self) -> None:
+        """Refresh the cached trust level and QA rate from the score."""
+        for upper, level in _BANDS:
+            if self._score <= upper:
+                self._level = level
+                self._qa_rate = _QA_RATES[level]
+                return
 
     @property
-    def history(self) -> list[TrustEvent]:
-        """Full history of trust events."""
-        return list(self._history)
+    def history(self) -> tuple[TrustEvent, ...]:
+        """History of trust events, oldest first (up to ``history_limit``).
+
+        Returned as an immutable snapshot that is reused until the next
+        ``update()``; call ``list(ts.history)`` if you need a mutable copy.
+        """
+        if self._history_snapshot is None:
+            self._history_snapshot = tuple(self._history)
+        return self._history_snapshot
 
     def update(
         self,
@@ -140,44 +227,61 @@ class TrustScore:
         Returns:
             The TrustEvent that was recorded.
         """
-        ts = timestamp or time.time()
-
-        if outcome == "good":
-            delta = 1
-            if not reason:
-                reason = f"Good output (stated {stated_confidence:.0f}%)"
-        elif outcome == "bad":
-            if stated_confidence >= 80:
-                delta = -3
-                if not reason:
-                    reason = f"Bad output with high confidence ({stated_confidence:.0f}%) — overconfident"
-            else:
-                delta = -1
-                if not reason:
-                    reason = f"Bad output with low confidence ({stated_confidence:.0f}%) — at least honest"
-        elif outcome == "flagged_real":
-            delta = 2
-            if not reason:
-                reason = "Flagged uncertainty that was confirmed real"
-        elif outcome == "hidden_problem":
-            delta = -3
-            if not reason:
-                reason = "QA found a problem the agent didn't flag"
-        else:
-            raise ValueError(f"Unknown outcome: {outcome!r}")
+        event = _make_event(stated_confidence, outcome, reason, timestamp)
 
-        self._score = max(self._min, min(self._max, self._score + delta))
+        score = self._score + event.delta
+        if score < self._min:
+            score = self._min
+        elif score > self._max:
+            score = self._max
+        if score != self._score:
+            self._score = score
+            self._recompute_level()
 
-        event = TrustEvent(
-            timestamp=ts,
-            stated_confidence=stated_confidence,
-            outcome=outcome,
-            delta=delta,
-            reason=reason,
-        )
         self._history.append(event)
+        self._history_snapshot = None
+        self._total_events += 1
         return event
 
+    def update_many(
+        self,
+        updates: Iterable[
+            tuple[float, Literal["good", "bad", "flagged_real", "hidden_problem"]]
+        ],
+    ) -> list[TrustEvent]:
+        """Record a batch of trust events in one step.
+
+        Equivalent to calling ``update(stated_confidence, outcome)`` for each
+        pair in order (the score is clamped after every event), but the
+        history and trust level are only updated once for the whole batch.
+
+        Args:
+            updates: ``(stated_confidence, outcome)`` pairs.
+
+        Returns:
+            The TrustEvents that were recorded, in order.
+        """
+        ts = time.time()
+        events = [_make_event(conf, outcome, "", ts) for conf, outcome in updates]
+        if not events:
+            return events
+
+        score = self._score
+        for event in events:
+            score += event.delta
+            if score < self._min:
+                score = self._min
+            elif score > self._max:
+                score = self._max
+        if score != self._score:
+            self._score = score
+            self._recompute_level()
+
+        self._history.extend(events)
+        self._history_snapshot = None
+        self._total_events += len(events)
+        return events
+
     def needs_qa(self) -> bool:
         """Whether this agent's outputs need QA review."""
         return self.trust_level in (TrustLevel.UNTRUSTED, TrustLevel.SUPERVISED)
@@ -189,12 +293,7 @@ class TrustScore:
             1.0 for UNTRUSTED, 0.5 for SUPERVISED, 0.2 for SPOT_CHECK,
             0.0 for AUTONOMOUS.
         """
-        return {
-            TrustLevel.UNTRUSTED: 1.0,
-            TrustLevel.SUPERVISED: 0.5,
-            TrustLevel.SPOT_CHECK: 0.2,
-            TrustLevel.AUTONOMOUS: 0.0,
-        }[self.trust_level]
+        return self._qa_rate
 
     def summary(self) -> dict[str, object]:
         """Return a summary dict suitable for logging or display."""
@@ -202,7 +301,7 @@ class TrustScore:
             "agent_id": self.agent_id,
             "score": self._score,
             "trust_level": self.trust_level.value,
-            "total_events": len(self._history),
+            "total_events": self._total_events,
             "needs_qa": self.needs_qa(),
             "qa_sample_rate": self.qa_sample_rate(),
         }
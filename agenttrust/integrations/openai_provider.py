@@ -6,8 +6,58 @@ built in. Requires the ``openai`` extra: ``pip install agenttrust[openai]``
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import weakref
 from typing import Any
 
+# Client settings: fail fast and retry inside the client, so one slow sample
+# doesn't hold up a whole consistency check.
+_CLIENT_TIMEOUT = 60.0
+_CLIENT_MAX_RETRIES = 2
+
+# Sync clients are thread-safe and shared per (api_key, base_url), so every
+# calibrated fn for the same endpoint reuses one HTTP connection pool.
+_CLIENT_CACHE: dict[tuple[str | None, str | None], Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _client_kwargs(api_key: str | None, base_url: str | None) -> dict[str, Any]:
+    client_kwargs: dict[str, Any] = {
+        "timeout": _CLIENT_TIMEOUT,
+        "max_retries": _CLIENT_MAX_RETRIES,
+    }
+    if api_key:
+        client_kwargs["api_key"] = api_key
+    if base_url:
+        client_kwargs["base_url"] = base_url
+    return client_kwargs
+
+
+def _get_client(api_key: str | None, base_url: str | None) -> Any:
+    """Return the shared sync ``OpenAI`` client for an endpoint."""
+    try:
+        from openai import OpenAI
+    except ImportError:
+        raise ImportError(
+            "openai package required. Install with: pip install agenttrust[openai]"
+        )
+
+    key = (api_key, base_url)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = OpenAI(**_client_kwargs(api_key, base_url))
+            _CLIENT_CACHE[key] = client
+    return client
+
+
+def _messages(system_prompt: str, query: str) -> list[dict[str, str]]:
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": query},
+    ]
+
 
 def create_calibrated_fn(
     model: str = "gpt-4o-mini",
@@ -20,7 +70,8 @@ def create_calibrated_fn(
 
     Returns a function ``fn(query: str) -> str`` that calls the OpenAI-compatible
     API. Works with OpenAI, Anthropic (via proxy), and any OpenAI-compatible
-    endpoint.
+    endpoint. Functions created for the same ``api_key``/``base_url`` share
+    one client and its connection pool.
 
     Args:
         model: Model name (e.g., "gpt-4o-mini", "claude-sonnet-4-20250514").
@@ -41,31 +92,91 @@ def create_calibrated_fn(
         >>> from agenttrust import sample_consistency
         >>> result = sample_consistency(fn, "What is 2+2?")  # doctest: +SKIP
     """
+    client = _get_client(api_key, base_url)
+
+    def fn(query: str) -> str:
+        response = client.chat.completions.create(
+            model=model,
+            messages=_messages(system_prompt, query),
+            temperature=kwargs.get("temperature", 0.7),
+            max_tokens=kwargs.get("max_tokens", 256),
+        )
+        return response.choices[0].message.content or ""
+
+    return fn
+
+
+def create_async_calibrated_fn(
+    model: str = "gpt-4o-mini",
+    api_key: str | None = None,
+    base_url: str | None = None,
+    system_prompt: str = "Answer concisely and accurately.",
+    max_concurrency: int | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Create an async callable suitable for ``sample_consistency_async``.
+
+    Like ``create_calibrated_fn``, but backed by ``AsyncOpenAI`` so that all
+    samples of a consistency check are in flight at once.
+
+    Args:
+        model: Model name (e.g., "gpt-4o-mini", "claude-sonnet-4-20250514").
+        api_key: API key. Falls back to OPENAI_API_KEY env var.
+        base_url: Custom base URL for Anthropic or other providers.
+        system_prompt: System prompt to use.
+        max_concurrency: Optional cap on concurrent requests from this
+            function (e.g., to respect provider rate limits).
+        **kwargs: Additional arguments passed to the API call.
+
+    Returns:
+        An async callable ``afn(query: str) -> str``.
+
+    Raises:
+        ImportError: If the ``openai`` package is not installed.
+
+    Example::
+
+        >>> afn = create_async_calibrated_fn(model="gpt-4o-mini")  # doctest: +SKIP
+        >>> from agenttrust import sample_consistency_async
+        >>> result = await sample_consistency_async(afn, "What is 2+2?")  # doctest: +SKIP
+    """
     try:
-        from openai import OpenAI
+        from openai import AsyncOpenAI
     except ImportError:
         raise ImportError(
             "openai package required. Install with: pip install agenttrust[openai]"
         )
 
-    client_kwargs: dict[str, Any] = {}
-    if api_key:
-        client_kwargs["api_key"] = api_key
-    if base_url:
-        client_kwargs["base_url"] = base_url
+    # Async clients and semaphores are bound to the event loop they first run
+    # on, so each loop that calls afn gets its own pair. Entries go away with
+    # their loop, e.g. after asyncio.run() returns.
+    client_kwargs = _client_kwargs(api_key, base_url)
+    per_loop: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, tuple[Any, asyncio.Semaphore | None]
+    ] = weakref.WeakKeyDictionary()
 
-    client = OpenAI(**client_kwargs)
+    def _loop_state() -> tuple[Any, asyncio.Semaphore | None]:
+        loop = asyncio.get_running_loop()
+        state = per_loop.get(loop)
+        if state is None:
+            semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+            state = per_loop[loop] = (AsyncOpenAI(**client_kwargs), semaphore)
+        return state
 
-    def fn(query: str) -> str:
-        response = client.chat.completions.create(
+    async def afn(query: str) -> str:
+        client, semaphore = _loop_state()
+        if semaphore is None:
+            return await _complete(client, query)
+        async with semaphore:
+            return await _complete(client, query)
+
+    async def _complete(client: Any, query: str) -> str:
+        response = await client.chat.completions.create(
             model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": query},
-            ],
+            messages=_messages(system_prompt, query),
             temperature=kwargs.get("temperature", 0.7),
             max_tokens=kwargs.get("max_tokens", 256),
         )
         return response.choices[0].message.content or ""
 
-    return fn
+    return afn
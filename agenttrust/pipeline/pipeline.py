@@ -7,8 +7,10 @@ based on the agent's trust level.
 
 from __future__ import annotations
 
+import random
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Literal
 
 from agenttrust.core.beipackzettel import Beipackzettel
 from agenttrust.core.trust_score import TrustScore
@@ -40,7 +42,7 @@ class AgentPipeline:
     Wraps any agent function with trust infrastructure. The pipeline:
     1. Plans (optional planning step)
     2. Executes (calls the agent function)
-    3. Reviews (QA based on trust level)
+    3. Reviews (QA sampled at the trust level's ``qa_sample_rate``)
     4. Delivers (only if QA passes or trust is high enough)
 
     Args:
@@ -48,12 +50,14 @@ class AgentPipeline:
         trust_score: The agent's TrustScore instance.
         tier: QA tier (1=quick, 2=standard, 3=deep).
         max_iterations: Max plan→execute→review cycles before giving up.
+        rng: Random source for QA sampling (default: the ``random`` module).
+            Pass a seeded ``random.Random`` for reproducible runs.
 
     Example::
 
         >>> def my_agent(query: str) -> tuple[str, Beipackzettel]:
         ...     return "Paris", Beipackzettel(confidence=90, sources=["wiki"])
-        >>> ts = TrustScore("my-agent", initial_score=50)
+        >>> ts = TrustScore("my-agent", initial_score=90)  # autonomous: no QA
         >>> pipeline = AgentPipeline(my_agent, ts)
         >>> result = pipeline.run("Capital of France?")
         >>> result.delivered
@@ -66,11 +70,13 @@ class AgentPipeline:
         trust_score: TrustScore,
         tier: int = 2,
         max_iterations: int = 3,
+        rng: random.Random | None = None,
     ) -> None:
         self.agent_fn = agent_fn
         self.trust_score = trust_score
         self.tier = tier
         self.max_iterations = max_iterations
+        self.rng = rng
 
     def run(self, query: str) -> PipelineResult:
         """Run the full pipeline for a query.
@@ -81,57 +87,113 @@ class AgentPipeline:
         Returns:
             PipelineResult with output, metadata, and delivery status.
         """
+        sampled = self._sample_qa(self.trust_score.qa_sample_rate())
+        result, outcome = self._run_once(query, sampled)
+        if outcome is not None:
+            self.trust_score.update(
+                stated_confidence=result.beipackzettel.confidence,
+                outcome=outcome,
+            )
+        return result
+
+    def run_many(
+        self,
+        queries: Iterable[str],
+        max_workers: int | None = None,
+    ) -> list[PipelineResult]:
+        """Run the pipeline for a batch of queries concurrently.
+
+        Queries run on a thread pool, so ``agent_fn`` must be thread-safe.
+        All queries are sampled for QA at the trust level in effect when the
+        batch starts, and the trust score is updated once for the whole batch
+        (see ``TrustScore.update_many``) after every query has finished.
+
+        Args:
+            queries: The tasks or questions for the agent.
+            max_workers: Maximum concurrent queries (default: the
+                ``ThreadPoolExecutor`` default). Use 1 to run sequentially.
+
+        Returns:
+            One PipelineResult per query, in input order.
+        """
+        queries = list(queries)
+        # Draw sampling decisions up front, in input order, so a seeded rng
+        # gives the same result regardless of thread scheduling
+        qa_rate = self.trust_score.qa_sample_rate()
+        sampled = [self._sample_qa(qa_rate) for _ in queries]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            runs = list(pool.map(self._run_once, queries, sampled))
+
+        self.trust_score.update_many(
+            (result.beipackzettel.confidence, outcome)
+            for result, outcome in runs
+            if outcome is not None
+        )
+        return [result for result, _ in runs]
+
+    def _sample_qa(self, qa_rate: float) -> bool:
+        """Decide whether a run is QA-reviewed, given the trust level's rate."""
+        if qa_rate >= 1.0:
+            return True
+        if qa_rate <= 0.0:
+            return False
+        draw = self.rng.random() if self.rng is not None else random.random()
+        return draw < qa_rate
+
+    def _run_once(
+        self,
+        query: str,
+        sampled: bool,
+    ) -> tuple[PipelineResult, Literal["good", "bad"] | None]:
+        """Run plan → execute → review for one query without touching trust.
+
+        Args:
+            query: The task or question for the agent.
+            sampled: Whether this run was picked for QA. The decision covers
+                the whole run, so every revision of a sampled run is reviewed.
+
+        Returns:
+            The PipelineResult and the trust outcome to record for it
+            (None if the output was not reviewed).
+        """
         for iteration in range(1, self.max_iterations + 1):
             # EXECUTE
             output, bpz = self.agent_fn(query)
 
-            # REVIEW (based on trust level)
-            qa_rate = self.trust_score.qa_sample_rate()
+            # REVIEW (only runs sampled for QA)
             review_result: ReviewResult | None = None
 
-            if qa_rate >= 1.0:
-                # Full QA
-                review_result = review(output, tier=self.tier)
-            elif qa_rate > 0:
-                # Spot check — always review for pipeline runs
+            if sampled:
                 review_result = review(output, tier=self.tier)
 
             # DELIVER decision
             if review_result is None:
-                # Autonomous — no QA needed
+                # Autonomous or not sampled — no QA needed
                 return PipelineResult(
                     output=output,
                     beipackzettel=bpz,
                     review_result=None,
                     delivered=True,
                     iterations=iteration,
-                )
+                ), None
 
             if review_result.verdict == "PASS":
-                self.trust_score.update(
-                    stated_confidence=bpz.confidence,
-                    outcome="good",
-                )
                 return PipelineResult(
                     output=output,
                     beipackzettel=bpz,
                     review_result=review_result,
                     delivered=True,
                     iterations=iteration,
-                )
+                ), "good"
 
             if review_result.verdict == "FAIL" or iteration == self.max_iterations:
-                self.trust_score.update(
-                    stated_confidence=bpz.confidence,
-                    outcome="bad",
-                )
                 return PipelineResult(
                     output=output,
                     beipackzettel=bpz,
                     review_result=review_result,
                     delivered=False,
                     iterations=iteration,
-                )
+                ), "bad"
 
             # REVISE — loop again
 
@@ -142,4 +204,4 @@ class AgentPipeline:
             review_result=review_result,
             delivered=False,
             iterations=self.max_iterations,
-        )
+        ), None
@@ -9,7 +9,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
-from agenttrust.qa.rubric import DIMENSIONS, RubricScore, create_rubric_score
+from agenttrust.qa.rubric import (
+    DIMENSIONS,
+    Dimension,
+    RubricScore,
+    create_rubric_score,
+    tier_thresholds,
+)
 
 
 @dataclass
@@ -32,9 +38,11 @@ class ReviewResult:
 
     def __post_init__(self) -> None:
         if not self.verdict:
-            if self.rubric_score.passes(self.tier):
+            total = self.rubric_score.total
+            pass_at, revise_at = tier_thresholds(self.tier)
+            if total >= pass_at:
                 self.verdict = "PASS"
-            elif self.rubric_score.total >= (self.tier * 4):
+            elif total >= revise_at:
                 self.verdict = "REVISE"
             else:
                 self.verdict = "FAIL"
@@ -42,8 +50,9 @@ class ReviewResult:
 
 def review(
     output: str,
-    score_fn: Callable[[str, dict[str, str]], int] | None = None,
+    score_fn: Callable[[str, Dimension], int] | None = None,
     tier: int = 2,
+    early_exit: bool = False,
 ) -> ReviewResult:
     """Review an agent output against the 8-dimension rubric.
 
@@ -53,82 +62,149 @@ def review(
 
     Args:
         output: The agent output text to review.
-        score_fn: Optional callable(output, dimension_dict) → int (0-2).
+        score_fn: Optional callable(output, dimension) → int (0-2).
             If None, uses a basic heuristic that checks for source citations,
             confidence statements, and structural markers.
         tier: Quality tier (1=quick, 2=standard, 3=deep). Affects pass threshold.
+        early_exit: Stop scoring once the verdict can no longer change
+            (PASS already reached, or even full marks on the rest would
+            FAIL). Remaining dimensions are scored 0 and listed in ``issues``
+            as skipped. Saves ``score_fn`` calls; the verdict is unaffected.
 
     Returns:
         ReviewResult with rubric scores, issues, and verdict.
     """
-    if score_fn is None:
-        score_fn = _heuristic_scorer
-
     scores: dict[str, int] = {}
     issues: list[str] = []
-
-    for dim in DIMENSIONS:
-        dim_score = score_fn(output, dim)
+    found = _scan_signals(output) if score_fn is None else frozenset()
+
+    pass_at, revise_at = tier_thresholds(tier)
+    fail_below = min(pass_at, revise_at)
+    total = 0
+
+    for i, dim in enumerate(DIMENSIONS):
+        if early_exit:
+            max_remaining = 2 * (len(DIMENSIONS) - i)
+            if total >= pass_at or total + max_remaining < fail_below:
+                for skipped in DIMENSIONS[i:]:
+                    scores[skipped.id] = 0
+                    issues.append(f"{skipped.name}: skipped — verdict decided")
+                break
+
+        if score_fn is None:
+            dim_score = _SCORERS.get(dim.id, _score_default)(found, output)
+        else:
+            dim_score = score_fn(output, dim)
         dim_score = max(0, min(2, dim_score))
-        scores[dim["id"]] = dim_score
+        scores[dim.id] = dim_score
+        total += dim_score
         if dim_score == 0:
-            issues.append(f"{dim['name']}: {dim['score_0']}")
+            issues.append(f"{dim.name}: {dim.score_0}")
 
     rubric = create_rubric_score(scores)
     return ReviewResult(rubric_score=rubric, issues=issues, tier=tier)
 
 
-def _heuristic_scorer(output: str, dimension: dict[str, str]) -> int:
+def _heuristic_scorer(output: str, dimension: Dimension) -> int:
     """Simple heuristic scorer for demo/testing purposes.
 
     Not a replacement for LLM-based review. Just checks for basic signals.
     """
+    scorer = _SCORERS.get(dimension.id, _score_default)
+    return scorer(_scan_signals(output), output)
+
+
+# Heuristic signals per dimension, matched case-insensitively
+_SOURCE_SIGNALS = ("http", "arxiv", "doi", "source:", "reference")
+_STRUCTURE_SIGNALS = ("\n\n", "##", "- ", "1.", "key takeaway")
+_HONESTY_SIGNALS = ("uncertain", "might", "unclear", "not sure", "assumption")
+_ACTION_SIGNALS = ("recommend", "next step", "should", "action", "todo")
+_CALIBRATION_SIGNALS = ("confidence:", "% confident")
+_RISK_SIGNALS = ("risk", "caveat", "limitation", "warning", "might fail")
+_BEIPACKZETTEL_SIGNAL = "beipackzettel"
+
+_ALL_SIGNALS: frozenset[str] = frozenset(
+    _SOURCE_SIGNALS
+    + _STRUCTURE_SIGNALS
+    + _HONESTY_SIGNALS
+    + _ACTION_SIGNALS
+    + _CALIBRATION_SIGNALS
+    + _RISK_SIGNALS
+    + (_BEIPACKZETTEL_SIGNAL,)
+)
+
+
+def _scan_signals(output: str) -> frozenset[str]:
+    """Return every heuristic signal present in ``output``.
+
+    Done once per review so each dimension scores with set lookups instead
+    of rescanning the text.
+    """
     text = output.lower()
-    dim_id = dimension["id"]
+    return frozenset(s for s in _ALL_SIGNALS if s in text)
+
+
+def _count_hits(found: frozenset[str], signals: tuple[str, ...]) -> int:
+    return sum(1 for s in signals if s in found)
+
 
-    if dim_id == "accuracy":
-        # Can't verify accuracy heuristically — give benefit of doubt
+# Each heuristic scorer takes (found_signals, original_output) and returns 0-2.
+
+def _score_accuracy(found: frozenset[str], output: str) -> int:
+    # Can't verify accuracy heuristically — give benefit of doubt
+    return 1
+
+
+def _score_completeness(found: frozenset[str], output: str) -> int:
+    if len(output) < 50:
+        return 0
+    elif len(output) < 200:
         return 1
+    return 2
+
 
-    elif dim_id == "completeness":
-        if len(output) < 50:
-            return 0
-        elif len(output) < 200:
-            return 1
+def _score_sources(found: frozenset[str], output: str) -> int:
+    hits = _count_hits(found, _SOURCE_SIGNALS)
+    if hits >= 2:
         return 2
+    elif hits >= 1:
+        return 1
+    return 0
 
-    elif dim_id == "sources":
-        source_signals = ["http", "arxiv", "doi", "source:", "reference"]
-        hits = sum(1 for s in source_signals if s in text)
-        if hits >= 2:
-            return 2
-        elif hits >= 1:
-            return 1
-        return 0
 
-    elif dim_id == "clarity":
-        structure_signals = ["\n\n", "##", "- ", "1.", "key takeaway"]
-        hits = sum(1 for s in structure_signals if s in text)
-        return min(2, hits)
+def _score_clarity(found: frozenset[str], output: str) -> int:
+    return min(2, _count_hits(found, _STRUCTURE_SIGNALS))
 
-    elif dim_id == "honesty":
-        honesty_signals = ["uncertain", "might", "unclear", "not sure", "assumption"]
-        hits = sum(1 for s in honesty_signals if s in text)
-        return min(2, hits)
 
-    elif dim_id == "actionability":
-        action_signals = ["recommend", "next step", "should", "action", "todo"]
-        hits = sum(1 for s in action_signals if s in text)
-        return min(2, hits)
+def _score_honesty(found: frozenset[str], output: str) -> int:
+    return min(2, _count_hits(found, _HONESTY_SIGNALS))
+
+
+def _score_actionability(found: frozenset[str], output: str) -> int:
+    return min(2, _count_hits(found, _ACTION_SIGNALS))
 
-    elif dim_id == "calibration":
-        if "confidence:" in text or "% confident" in text:
-            return 2 if "beipackzettel" in text else 1
-        return 0
 
-    elif dim_id == "risks":
-        risk_signals = ["risk", "caveat", "limitation", "warning", "might fail"]
-        hits = sum(1 for s in risk_signals if s in text)
-        return min(2, hits)
+def _score_calibration(found: frozenset[str], output: str) -> int:
+    if _count_hits(found, _CALIBRATION_SIGNALS):
+        return 2 if _BEIPACKZETTEL_SIGNAL in found else 1
+    return 0
 
+
+def _score_risks(found: frozenset[str], output: str) -> int:
+    return min(2, _count_hits(found, _RISK_SIGNALS))
+
+
+def _score_default(found: frozenset[str], output: str) -> int:
     return 1  # default: partial
+
+
+_SCORERS: dict[str, Callable[[frozenset[str], str], int]] = {
+    "accuracy": _score_accuracy,
+    "completeness": _score_completeness,
+    "sources": _score_sources,
+    "clarity": _score_clarity,
+    "honesty": _score_honesty,
+    "actionability": _score_actionability,
+    "calibration": _score_calibration,
+    "risks": _score_risks,
+}
@@ -27,72 +27,122 @@ class Score(IntEnum):
     SOLID = 2
 
 
-DIMENSIONS: list[dict[str, str]] = [
-    {
-        "id": "accuracy",
-        "name": "Factual Accuracy",
-        "description": "Claims are correct and verifiable. No hallucinations.",
-        "score_0": "Contains factual errors or unverifiable claims",
-        "score_1": "Mostly accurate, minor issues or unverified claims",
-        "score_2": "All claims accurate and verifiable",
-    },
-    {
-        "id": "completeness",
-        "name": "Completeness",
-        "description": "Covers the topic adequately. No major gaps.",
-        "score_0": "Major aspects missing",
-        "score_1": "Covers basics but misses important nuances",
-        "score_2": "Comprehensive coverage appropriate for the task",
-    },
-    {
-        "id": "sources",
-        "name": "Source Quality",
-        "description": "Sources are cited, relevant, and accessible.",
-        "score_0": "No sources or irrelevant sources",
-        "score_1": "Some sources but gaps in citation or relevance",
-        "score_2": "Well-sourced with relevant, accessible references",
-    },
-    {
-        "id": "clarity",
-        "name": "Clarity & Structure",
-        "description": "Well-organized, easy to follow, appropriate format.",
-        "score_0": "Disorganized or hard to follow",
-        "score_1": "Readable but could be better structured",
-        "score_2": "Clear, well-structured, appropriate format",
-    },
-    {
-        "id": "honesty",
-        "name": "Epistemic Honesty",
-        "description": "Distinguishes evidence from interpretation. Flags uncertainty.",
-        "score_0": "Presents speculation as fact, no uncertainty flagged",
-        "score_1": "Some distinction but blurs evidence and interpretation",
-        "score_2": "Clear separation of evidence, interpretation, and judgment",
-    },
-    {
-        "id": "actionability",
-        "name": "Actionability",
-        "description": "Output leads to clear next steps or decisions.",
-        "score_0": "No actionable takeaways",
-        "score_1": "Some actionable content but vague",
-        "score_2": "Clear, specific, actionable recommendations",
-    },
-    {
-        "id": "calibration",
-        "name": "Confidence Calibration",
-        "description": "Stated confidence matches actual quality. Beipackzettel present.",
-        "score_0": "No confidence stated or wildly miscalibrated",
-        "score_1": "Confidence stated but over/underconfident",
-        "score_2": "Confidence well-calibrated, Beipackzettel complete",
-    },
-    {
-        "id": "risks",
-        "name": "Risk Awareness",
-        "description": "Known risks, limitations, and failure modes are flagged.",
-        "score_0": "No risks mentioned despite obvious ones",
-        "score_1": "Some risks flagged but incomplete",
-        "score_2": "Comprehensive risk awareness",
-    },
-]
+@dataclass(frozen=True, slots=True)
+class Dimension:
+    """One rubric dimension with its scoring guide.
+
+    Supports ``dim["id"]``-style item access for score functions written
+    against the earlier dict-based rubric.
+
+    Attributes:
+        id: Stable identifier used as the key in rubric scores.
+        name: Human-readable dimension name.
+        description: What the dimension measures.
+        score_0: What a score of 0 looks like.
+        score_1: What a score of 1 looks like.
+        score_2: What a score of 2 looks like.
+    """
+
+    id: str
+    name: str
+    description: str
+    score_0: str
+    score_1: str
+    score_2: str
+
+    def __getitem__(self, key: str) -> str:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+DIMENSIONS: tuple[Dimension, ...] = (
+    Dimension(
+        id="accuracy",
+        name="Factual Accuracy",
+        description="Claims are correct and verifiable. No hallucinations.",
+        score_0="Contains factual errors or unverifiable claims",
+        score_1="Mostly accurate, minor issues or unverified claims",
+        score_2="All claims accurate and verifiable",
+    ),
+    Dimension(
+        id="completeness",
+        name="Completeness",
+        description="Covers the topic adequately. No major gaps.",
+        score_0="Major aspects missing",
+        score_1="Covers basics but misses important nuances",
+        score_2="Comprehensive coverage appropriate for the task",
+    ),
+    Dimension(
+        id="sources",
+        name="Source Quality",
+        description="Sources are cited, relevant, and accessible.",
+        score_0="No sources or irrelevant sources",
+        score_1="Some sources but gaps in citation or relevance",
+        score_2="Well-sourced with relevant, accessible references",
+    ),
+    Dimension(
+        id="clarity",
+        name="Clarity & Structure",
+        description="Well-organized, easy to follow, appropriate format.",
+        score_0="Disorganized or hard to follow",
+        score_1="Readable but could be better structured",
+        score_2="Clear, well-structured, appropriate format",
+    ),
+    Dimension(
+        id="honesty",
+        name="Epistemic Honesty",
+        description="Distinguishes evidence from interpretation. Flags uncertainty.",
+        score_0="Presents speculation as fact, no uncertainty flagged",
+        score_1="Some distinction but blurs evidence and interpretation",
+        score_2="Clear separation of evidence, interpretation, and judgment",
+    ),
+    Dimension(
+        id="actionability",
+        name="Actionability",
+        description="Output leads to clear next steps or decisions.",
+        score_0="No actionable takeaways",
+        score_1="Some actionable content but vague",
+        score_2="Clear, specific, actionable recommendations",
+    ),
+    Dimension(
+        id="calibration",
+        name="Confidence Calibration",
+        description="Stated confidence matches actual quality. Beipackzettel present.",
+        score_0="No confidence stated or wildly miscalibrated",
+        score_1="Confidence stated but over/underconfident",
+        score_2="Confidence well-calibrated, Beipackzettel complete",
+    ),
+    Dimension(
+        id="risks",
+        name="Risk Awareness",
+        description="Known risks, limitations, and failure modes are flagged.",
+        score_0="No risks mentioned despite obvious ones",
+        score_1="Some risks flagged but incomplete",
+        score_2="Comprehensive risk awareness",
+    ),
+)
+
+
+# Minimum total score to PASS / to REVISE rather than FAIL, indexed by tier.
+# Index 0 is unused so that tiers 1-3 index directly.
+PASS_THRESHOLDS: tuple[int, ...] = (0, 10, 12, 14)
+REVISE_THRESHOLDS: tuple[int, ...] = (0, 4, 8, 12)
+
+
+def tier_thresholds(tier: int) -> tuple[int, int]:
+    """Return the (pass, revise) score thresholds for a tier.
+
+    Unknown tiers pass at 12 (the tier-2 bar) and revise at ``tier * 4``.
+    """
+    if 1 <= tier <= 3:
+        return PASS_THRESHOLDS[tier], REVISE_THRESHOLDS[tier]
+    return 12, tier * 4
+
+
+_VALID_IDS: frozenset[str] = frozenset(d.id for d in DIMENSIONS)
+_VALID_SCORES: frozenset[int] = frozenset(Score)
 
 
 @dataclass(frozen=True)
@@ -115,8 +165,7 @@ class RubricScore:
         Args:
             tier: 1 (≥10), 2 (≥12), or 3 (≥14).
         """
-        thresholds = {1: 10, 2: 12, 3: 14}
-        return self.total >= thresholds.get(tier, 12)
+        return self.total >= tier_thresholds(tier)[0]
 
     def weakest(self) -> list[str]:
         """Return dimension ids that scored 0."""
@@ -137,12 +186,12 @@ def create_rubric_score(scores: dict[str, int]) -> RubricScore:
     Raises:
         ValueError: If invalid dimension ids or scores outside 0-2.
     """
-    valid_ids = {d["id"] for d in DIMENSIONS}
+    total = 0
     for dim_id, score in scores.items():
-        if dim_id not in valid_ids:
+        if dim_id not in _VALID_IDS:
             raise ValueError(f"Unknown dimension: {dim_id!r}")
-        if score not in (0, 1, 2):
+        if score not in _VALID_SCORES:
             raise ValueError(f"Score must be 0-2, got {score} for {dim_id!r}")
+        total += score
 
-    total = sum(scores.values())
     return RubricScore(scores=scores, total=total)
@@ -2,10 +2,13 @@
 
 from agenttrust import sample_consistency
 
-# Any function that answers a question — swap in your LLM
+# Any function that answers a question — swap in your LLM.
+# Replayed answers must be drawn in order, so sample sequentially.
 answers = iter(["Paris", "Paris", "Paris"])
-result = sample_consistency(lambda q: next(answers), "What is the capital of France?")
+result = sample_consistency(
+    lambda q: next(answers), "What is the capital of France?", parallel=False
+)
 
-print(f"Confidence: {result.confidence_level.value} ({result.confidence_pct}%)")
+print(f"Confidence: {result.confidence_level.value} ({result.confidence_pct:.1f}%)")
 print(f"Agreement:  {result.agreement_ratio:.0%} ({len(result.samples)} samples)")
 print(f"Answer:     {result.majority_answer}")
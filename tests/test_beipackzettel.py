@@ -0,0 +1,18 @@
+"""Tests for the Beipackzettel output metadata."""
+
+from agenttrust.core.beipackzettel import Beipackzettel
+from agenttrust.core.calibration import verbalized_confidence
+
+
+class TestToDict:
+    def test_rounds_confidence_for_presentation(self) -> None:
+        calibrated = verbalized_confidence("I'm 90% confident").calibrated_confidence
+        bpz = Beipackzettel(confidence=calibrated)
+        assert bpz.confidence == calibrated  # full precision kept on the object
+        assert bpz.to_dict()["confidence"] == 63.0
+
+    def test_includes_derived_fields(self) -> None:
+        bpz = Beipackzettel(confidence=85, sources=["wiki"])
+        data = bpz.to_dict()
+        assert data["is_grounded"] is True
+        assert data["risk_level"] == "low"
@@ -1,5 +1,11 @@
 """Tests for Budget-CoCoA calibration."""
 
+import asyncio
+import itertools
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from agenttrust.core.calibration import (
@@ -7,9 +13,15 @@ from agenttrust.core.calibration import (
     ConfidenceLevel,
     VerbalizedConfidenceResult,
     sample_consistency,
+    sample_consistency_async,
+    sample_consistency_batch,
+    sample_consistency_iter,
+    sample_consistency_streaming,
+    source_signal_confidence,
     verbalized_confidence,
     _normalize,
     _compute_agreement,
+    _CONFIDENCE_PATTERN,
 )
 
 
@@ -29,32 +41,45 @@ class TestNormalize:
     def test_collapses_whitespace(self) -> None:
         assert _normalize("hello   world") == "hello world"
 
+    def test_folds_compatibility_forms(self) -> None:
+        assert _normalize("Ｐａｒｉｓ") == "paris"
+        assert _normalize("ﬁve") == "five"
+
 
 # --- _compute_agreement ---
 
 class TestComputeAgreement:
     def test_full_agreement(self) -> None:
-        ratio, majority = _compute_agreement(["Paris", "Paris", "Paris"])
-        assert ratio == 1.0
+        agreeing, majority, _ = _compute_agreement(["Paris", "Paris", "Paris"])
+        assert agreeing == 3
         assert majority == "paris"
 
     def test_partial_agreement(self) -> None:
-        ratio, majority = _compute_agreement(["Paris", "Paris", "London"])
-        assert abs(ratio - 2 / 3) < 0.01
+        agreeing, majority, _ = _compute_agreement(["Paris", "Paris", "London"])
+        assert agreeing == 2
         assert majority == "paris"
 
     def test_no_agreement(self) -> None:
-        ratio, majority = _compute_agreement(["Paris", "London", "Berlin"])
-        assert abs(ratio - 1 / 3) < 0.01
+        agreeing, majority, _ = _compute_agreement(["Paris", "London", "Berlin"])
+        assert agreeing == 1
         assert majority is None
 
+    def test_counts_beyond_fast_path(self) -> None:
+        agreeing, majority, _ = _compute_agreement(["a", "b", "a", "c", "a"])
+        assert agreeing == 3
+        assert majority == "a"
+
+    def test_returns_normalized_samples(self) -> None:
+        _, _, normalized = _compute_agreement(["Paris.", " PARIS", "Lyon"])
+        assert normalized == ("paris", "paris", "lyon")
+
     def test_case_insensitive(self) -> None:
-        ratio, _ = _compute_agreement(["Paris", "paris", "PARIS"])
-        assert ratio == 1.0
+        agreeing, _, _ = _compute_agreement(["Paris", "paris", "PARIS"])
+        assert agreeing == 3
 
     def test_punctuation_insensitive(self) -> None:
-        ratio, _ = _compute_agreement(["Paris.", "Paris!", "Paris"])
-        assert ratio == 1.0
+        agreeing, _, _ = _compute_agreement(["Paris.", "Paris!", "Paris"])
+        assert agreeing == 3
 
 
 # --- sample_consistency ---
@@ -62,24 +87,44 @@ class TestComputeAgreement:
 class TestSampleConsistency:
     def test_high_confidence(self) -> None:
         answers = iter(["Paris", "Paris", "Paris"])
-        result = sample_consistency(lambda q: next(answers), "capital of France?")
+        result = sample_consistency(
+            lambda q: next(answers), "capital of France?", parallel=False
+        )
         assert result.confidence_level == ConfidenceLevel.HIGH
         assert result.agreement_ratio == 1.0
         assert result.majority_answer == "paris"
+        assert result.normalized_samples == ("paris", "paris", "paris")
+
+    def test_level_serializes_to_json(self) -> None:
+        result = sample_consistency(lambda q: "yes", "test?")
+        assert json.dumps(result.confidence_level) == '"high"'
+
+    def test_level_renders_as_value(self) -> None:
+        level = ConfidenceLevel.MEDIUM
+        assert str(level) == "medium"
+        assert f"{level}" == "medium"
+        assert f"{level:>8}" == "  medium"
 
     def test_medium_confidence(self) -> None:
         answers = iter(["Paris", "Paris", "Lyon"])
-        result = sample_consistency(lambda q: next(answers), "capital of France?")
+        result = sample_consistency(
+            lambda q: next(answers), "capital of France?", parallel=False
+        )
         assert result.confidence_level == ConfidenceLevel.MEDIUM
+        assert result.agreement_ratio == 2 / 3  # stored unrounded
 
     def test_low_confidence(self) -> None:
         answers = iter(["Paris", "Lyon", "Marseille"])
-        result = sample_consistency(lambda q: next(answers), "capital of France?")
+        result = sample_consistency(
+            lambda q: next(answers), "capital of France?", parallel=False
+        )
         assert result.confidence_level == ConfidenceLevel.LOW
 
     def test_custom_n(self) -> None:
         answers = iter(["A", "A", "A", "A", "B"])
-        result = sample_consistency(lambda q: next(answers), "test?", n=5)
+        result = sample_consistency(
+            lambda q: next(answers), "test?", n=5, parallel=False
+        )
         assert len(result.samples) == 5
         assert result.agreement_ratio == 0.8
 
@@ -93,6 +138,191 @@ class TestSampleConsistency:
         assert result.query == "test?"
         assert 30 <= result.confidence_pct <= 95
 
+    def test_shared_executor(self) -> None:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            result = sample_consistency(lambda q: "yes", "test?", executor=pool)
+            assert result.confidence_level == ConfidenceLevel.HIGH
+            assert len(result.samples) == 3
+
+    def test_sequential_preserves_order(self) -> None:
+        answers = iter(["A", "B", "A", "C", "A"])
+        result = sample_consistency(
+            lambda q: next(answers), "test?", n=5, parallel=False
+        )
+        assert result.samples == ("A", "B", "A", "C", "A")
+        assert result.agreement_ratio == 0.6
+
+    def test_batch_fn(self) -> None:
+        calls = []
+
+        def batch(q: str, n: int) -> list[str]:
+            calls.append(n)
+            return ["Paris", "Paris", "Lyon"]
+
+        result = sample_consistency(lambda q: "unused", "capital?", batch_fn=batch)
+        assert calls == [3]
+        assert result.samples == ("Paris", "Paris", "Lyon")
+        assert result.confidence_level == ConfidenceLevel.MEDIUM
+
+    def test_batch_fn_wrong_count_raises(self) -> None:
+        with pytest.raises(ValueError, match="expected 3"):
+            sample_consistency(lambda q: "x", "q?", batch_fn=lambda q, n: ["x"])
+
+
+# --- sample_consistency_async ---
+
+class TestSampleConsistencyAsync:
+    def test_gathers_samples(self) -> None:
+        answers = iter(["Paris", "Paris", "Lyon"])
+
+        async def fn(q: str) -> str:
+            return next(answers)
+
+        result = asyncio.run(sample_consistency_async(fn, "capital of France?"))
+        assert result.confidence_level == ConfidenceLevel.MEDIUM
+        assert result.samples == ("Paris", "Paris", "Lyon")
+
+    def test_n_less_than_2_raises(self) -> None:
+        async def fn(q: str) -> str:
+            return "x"
+
+        with pytest.raises(ValueError, match="at least 2"):
+            asyncio.run(sample_consistency_async(fn, "test?", n=1))
+
+
+# --- sample_consistency_streaming ---
+
+class TestSampleConsistencyStreaming:
+    def test_stops_once_majority_locked(self) -> None:
+        calls = []
+
+        def fn(q: str) -> str:
+            calls.append(q)
+            return "Paris"
+
+        result = sample_consistency_streaming(fn, "capital of France?")
+        assert len(calls) == 2
+        assert result.samples == ("Paris", "Paris")
+        assert result.majority_answer == "paris"
+        # Undrawn sample counts as disagreeing: 2/3, not 2/2
+        assert result.agreement_ratio == 2 / 3
+        assert result.confidence_level == ConfidenceLevel.MEDIUM
+
+    def test_draws_all_samples_without_majority(self) -> None:
+        answers = iter(["Paris", "Lyon", "Paris"])
+        result = sample_consistency_streaming(lambda q: next(answers), "q?")
+        assert len(result.samples) == 3
+        assert result.agreement_ratio == 2 / 3
+        assert result.majority_answer == "paris"
+
+
+# --- sample_consistency_iter ---
+
+class TestSampleConsistencyIter:
+    def test_yields_partial_results_until_last(self) -> None:
+        results = list(sample_consistency_iter(lambda q: "Paris", "q?", n=3))
+        assert [len(r.samples) for r in results] == [1, 2, 3]
+        assert [r.partial for r in results] == [True, True, False]
+        assert [r.confidence_level for r in results] == [
+            ConfidenceLevel.LOW, ConfidenceLevel.MEDIUM, ConfidenceLevel.HIGH,
+        ]
+
+    def test_early_stop_ends_on_locked_majority(self) -> None:
+        results = list(
+            sample_consistency_iter(lambda q: "Paris", "q?", n=5, early_stop=True)
+        )
+        assert len(results) == 3
+        assert not results[-1].partial
+        assert results[-1].agreement_ratio == 3 / 5
+
+
+    def test_running_tally_matches_full_recount(self) -> None:
+        answers = ["A", "B", "B", "a."]
+        it = iter(answers)
+        results = list(sample_consistency_iter(lambda q: next(it), "q?", n=4))
+        assert [r.majority_answer for r in results] == ["a", None, "b", "a"]
+        agreeing, majority, normalized = _compute_agreement(answers)
+        assert results[-1].majority_answer == majority
+        assert results[-1].agreement_ratio == agreeing / 4
+        assert results[-1].normalized_samples == normalized
+
+
+# --- sample_consistency_batch ---
+
+class TestSampleConsistencyBatch:
+    def test_scores_each_sample_set(self) -> None:
+        results = sample_consistency_batch([
+            ("capital of France?", ["Paris", "Paris", "paris"]),
+            ("capital of Spain?", ["Madrid", "Madrid", "Barcelona"]),
+        ])
+        assert [r.query for r in results] == ["capital of France?", "capital of Spain?"]
+        assert results[0].confidence_level == ConfidenceLevel.HIGH
+        assert results[1].confidence_level == ConfidenceLevel.MEDIUM
+        assert results[1].majority_answer == "madrid"
+
+    def test_too_few_samples_raises(self) -> None:
+        with pytest.raises(ValueError, match="at least 2"):
+            sample_consistency_batch([("q?", ["only one"])])
+
+
+# --- source_signal_confidence ---
+
+_MARKERS = ("has_doi", "has_url", "has_percentage", "has_year", "has_source_ref")
+_MARKER_WEIGHTS = (0.30, 0.15, 0.10, 0.05, 0.10)
+
+
+class TestSourceSignalConfidence:
+    def test_three_signal_formula(self) -> None:
+        r = source_signal_confidence(
+            "claim", admiralty="A1", verification="verified", has_doi=True,
+            has_percentage=True,
+        )
+        assert r.source_signal == pytest.approx(0.95 * 1.0 * 0.8)
+        assert r.consistency_signal == 0.85
+        assert r.structural_signal == pytest.approx(0.40)
+        assert r.confidence_pct == pytest.approx(71.5)
+
+    def test_structural_markers_match_capped_sum(self) -> None:
+        for present in itertools.product((False, True), repeat=len(_MARKERS)):
+            r = source_signal_confidence("claim", **dict(zip(_MARKERS, present)))
+            expected = min(0.50, sum(w for w, on in zip(_MARKER_WEIGHTS, present) if on))
+            assert r.structural_signal == pytest.approx(expected), present
+
+    def test_markers_accept_any_truthy_value(self) -> None:
+        doi = source_signal_confidence("claim", has_doi=2)
+        assert doi.structural_signal == pytest.approx(0.30)
+
+        url = source_signal_confidence("claim", has_url=re.search("http", "http://x"))
+        assert url.structural_signal == pytest.approx(0.15)
+
+        none = source_signal_confidence("claim", has_url=None, has_year=0)
+        assert none.structural_signal == 0.0
+
+    def test_recency_discount(self) -> None:
+        def source(**kwargs) -> float:
+            return source_signal_confidence(
+                "claim", admiralty="A1", verification="verified", **kwargs
+            ).source_signal
+
+        assert source(evidence_year=2026) == pytest.approx(0.95)
+        assert source(evidence_year=2023) == pytest.approx(0.95 * 0.7)
+        assert source(evidence_year=1990) == pytest.approx(0.95 * 0.5)
+        assert source(evidence_year=2027) == pytest.approx(0.95 * 1.1)
+        assert source() == pytest.approx(0.95 * 0.8)
+
+    def test_recency_accepts_float_years(self) -> None:
+        as_float = source_signal_confidence("claim", evidence_year=2020.0)
+        as_int = source_signal_confidence("claim", evidence_year=2020)
+        assert as_float.source_signal == pytest.approx(as_int.source_signal)
+        half_year = source_signal_confidence("claim", evidence_year=2025.5)
+        assert half_year.source_signal == pytest.approx(0.4 * 0.5 * 0.95)
+
+    def test_repeated_calls_are_equal(self) -> None:
+        first = source_signal_confidence("a", admiralty="B2", evidence_year=2023)
+        second = source_signal_confidence("b", admiralty="B2", evidence_year=2023)
+        assert first.confidence_pct == second.confidence_pct
+        assert (first.claim, second.claim) == ("a", "b")
+
 
 # --- verbalized_confidence ---
 
@@ -132,3 +362,21 @@ class TestVerbalizedConfidence:
         # "certainty: X%"
         r3 = verbalized_confidence("certainty: 60%")
         assert r3.stated_confidence == 60.0
+
+    def test_decimal_and_sure_formats(self) -> None:
+        assert verbalized_confidence("confidence: 72.5%").stated_confidence == 72.5
+        assert verbalized_confidence("I'm 85 % sure").stated_confidence == 85.0
+
+    def test_pattern_compiles_under_re2(self) -> None:
+        re2 = pytest.importorskip("re2")
+        pattern = re2.compile(_CONFIDENCE_PATTERN.pattern)
+        cases = {
+            "confidence: 85%": ("85", None),     # keyword first → group 1
+            "I am 75% confident": (None, "75"),  # number first → group 2
+            "certainty: 60%": ("60", None),
+            "I'm 85 % sure": (None, "85"),
+        }
+        for text, groups in cases.items():
+            match = pattern.search(text.lower())
+            assert match is not None, text
+            assert (match.group(1), match.group(2)) == groups
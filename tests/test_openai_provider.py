@@ -0,0 +1,140 @@
+"""Tests for the OpenAI provider wrapper, using a stub ``openai`` module."""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from agenttrust.integrations import openai_provider
+from agenttrust.integrations.openai_provider import (
+    create_async_calibrated_fn,
+    create_calibrated_fn,
+)
+
+
+def _response(content: str) -> types.SimpleNamespace:
+    message = types.SimpleNamespace(content=content)
+    return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+class _StubOpenAI:
+    instances: list["_StubOpenAI"] = []
+
+    def __init__(self, **kwargs) -> None:
+        self.kwargs = kwargs
+        self.requests: list[dict] = []
+        self.chat = types.SimpleNamespace(
+            completions=types.SimpleNamespace(create=self._create)
+        )
+        type(self).instances.append(self)
+
+    def _create(self, **request):
+        self.requests.append(request)
+        return _response(f"answer to {request['messages'][-1]['content']}")
+
+
+class _StubAsyncOpenAI(_StubOpenAI):
+    instances: list["_StubAsyncOpenAI"] = []
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _create(self, **request):
+        cls = type(self)
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            self.requests.append(request)
+            return _response(f"answer to {request['messages'][-1]['content']}")
+        finally:
+            cls.in_flight -= 1
+
+
+@pytest.fixture(autouse=True)
+def stub_openai(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = types.ModuleType("openai")
+    module.OpenAI = _StubOpenAI
+    module.AsyncOpenAI = _StubAsyncOpenAI
+    monkeypatch.setitem(sys.modules, "openai", module)
+    monkeypatch.setattr(openai_provider, "_CLIENT_CACHE", {})
+    monkeypatch.setattr(_StubOpenAI, "instances", [])
+    monkeypatch.setattr(_StubAsyncOpenAI, "instances", [])
+    monkeypatch.setattr(_StubAsyncOpenAI, "max_in_flight", 0)
+
+
+# --- create_calibrated_fn ---
+
+class TestCreateCalibratedFn:
+    def test_calls_chat_completions(self) -> None:
+        fn = create_calibrated_fn(model="m", system_prompt="sys", temperature=0.2)
+        assert fn("q?") == "answer to q?"
+        request = _StubOpenAI.instances[0].requests[0]
+        assert request["model"] == "m"
+        assert request["temperature"] == 0.2
+        assert request["messages"][0] == {"role": "system", "content": "sys"}
+
+    def test_client_settings(self) -> None:
+        create_calibrated_fn(api_key="k", base_url="https://x")
+        assert _StubOpenAI.instances[0].kwargs == {
+            "timeout": openai_provider._CLIENT_TIMEOUT,
+            "max_retries": openai_provider._CLIENT_MAX_RETRIES,
+            "api_key": "k",
+            "base_url": "https://x",
+        }
+
+    def test_shares_client_per_endpoint(self) -> None:
+        create_calibrated_fn(model="a", api_key="k")
+        create_calibrated_fn(model="b", api_key="k")
+        assert len(_StubOpenAI.instances) == 1
+        create_calibrated_fn(api_key="k", base_url="https://other")
+        assert len(_StubOpenAI.instances) == 2
+
+    def test_missing_openai_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setitem(sys.modules, "openai", None)
+        with pytest.raises(ImportError, match="agenttrust\\[openai\\]"):
+            create_calibrated_fn()
+
+
+# --- create_async_calibrated_fn ---
+
+class TestCreateAsyncCalibratedFn:
+    def test_reusable_across_event_loops(self) -> None:
+        afn = create_async_calibrated_fn(max_concurrency=1)
+
+        async def burst() -> list[str]:
+            return await asyncio.gather(*(afn(f"q{i}") for i in range(3)))
+
+        assert asyncio.run(burst()) == ["answer to q0", "answer to q1", "answer to q2"]
+        assert asyncio.run(burst()) == ["answer to q0", "answer to q1", "answer to q2"]
+        # One client per event loop
+        assert len(_StubAsyncOpenAI.instances) == 2
+
+    def test_one_client_per_loop(self) -> None:
+        afn = create_async_calibrated_fn()
+
+        async def twice() -> None:
+            await afn("a")
+            await afn("b")
+
+        asyncio.run(twice())
+        assert len(_StubAsyncOpenAI.instances) == 1
+        assert len(_StubAsyncOpenAI.instances[0].requests) == 2
+
+    def test_max_concurrency_caps_in_flight_requests(self) -> None:
+        afn = create_async_calibrated_fn(max_concurrency=2)
+
+        async def burst() -> None:
+            await asyncio.gather(*(afn(f"q{i}") for i in range(6)))
+
+        asyncio.run(burst())
+        assert _StubAsyncOpenAI.max_in_flight == 2
+
+    def test_unbounded_by_default(self) -> None:
+        afn = create_async_calibrated_fn()
+
+        async def burst() -> None:
+            await asyncio.gather(*(afn(f"q{i}") for i in range(6)))
+
+        asyncio.run(burst())
+        assert _StubAsyncOpenAI.max_in_flight == 6
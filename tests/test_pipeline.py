@@ -0,0 +1,154 @@
+"""Tests for the agent pipeline."""
+
+import random
+
+from agenttrust.core.beipackzettel import Beipackzettel
+from agenttrust.core.trust_score import TrustEvent, TrustScore
+from agenttrust.pipeline.pipeline import AgentPipeline
+
+
+# Scores 15/16 with the heuristic reviewer → PASS at tier 2
+PASS_OUTPUT = """## Answer
+
+Paris is the capital of France. Source: https://en.wikipedia.org/wiki/Paris (reference).
+
+It might be unclear for historical periods. I recommend checking the next step.
+Confidence: 90% in this Beipackzettel. Risk: limitation of a single source."""
+
+# Scores 8/16 with the heuristic reviewer → REVISE at tier 2
+REVISE_OUTPUT = """## Answer
+
+Paris is the capital of France, per the encyclopedia entry and the official portal.
+Source: https://example.org. I recommend citing it; a limitation is one source."""
+
+
+class _CountingTrustScore(TrustScore):
+    """TrustScore that counts calls to update() and update_many()."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.update_calls = 0
+        self.update_many_calls = 0
+
+    def update(self, *args, **kwargs) -> TrustEvent:
+        self.update_calls += 1
+        return super().update(*args, **kwargs)
+
+    def update_many(self, updates) -> list[TrustEvent]:
+        self.update_many_calls += 1
+        return super().update_many(updates)
+
+
+class _FixedRandom(random.Random):
+    """Random source whose draws are always ``value``."""
+
+    def __init__(self, value: float) -> None:
+        super().__init__()
+        self.value = value
+        self.draws = 0
+
+    def random(self) -> float:
+        self.draws += 1
+        return self.value
+
+
+def _agent(*outputs: str):
+    """Agent returning ``outputs`` in turn (repeating the last), recording calls."""
+    calls: list[str] = []
+
+    def fn(query: str) -> tuple[str, Beipackzettel]:
+        calls.append(query)
+        output = outputs[min(len(calls), len(outputs)) - 1]
+        return output, Beipackzettel(confidence=90, sources=["wiki"])
+
+    return fn, calls
+
+
+# --- QA sampling ---
+
+class TestQASampling:
+    def test_sampled_run_reviews_every_iteration(self) -> None:
+        fn, calls = _agent(REVISE_OUTPUT)
+        ts = TrustScore("a", initial_score=50)  # SUPERVISED: 50% QA
+        result = AgentPipeline(fn, ts, rng=_FixedRandom(0.0)).run("q?")
+
+        assert len(calls) == 3
+        assert result.iterations == 3
+        assert ts.history[0].delta == -3
+        assert result.review_result is not None
+        assert result.review_result.verdict == "REVISE"
+        assert not result.delivered
+        assert [e.outcome for e in ts.history] == ["bad"]
+
+    def test_unsampled_run_delivers_without_review(self) -> None:
+        fn, calls = _agent(REVISE_OUTPUT)
+        ts = TrustScore("a", initial_score=50)
+        result = AgentPipeline(fn, ts, rng=_FixedRandom(0.99)).run("q?")
+
+        assert len(calls) == 1
+        assert result.delivered
+        assert result.review_result is None
+        assert ts.history == ()
+
+    def test_revised_output_is_reviewed_before_delivery(self) -> None:
+        fn, _ = _agent(REVISE_OUTPUT, PASS_OUTPUT)
+        ts = TrustScore("a", initial_score=50)
+        result = AgentPipeline(fn, ts, rng=_FixedRandom(0.0)).run("q?")
+
+        assert result.iterations == 2
+        assert result.delivered
+        assert result.review_result is not None
+        assert result.review_result.verdict == "PASS"
+        assert [e.outcome for e in ts.history] == ["good"]
+
+    def test_no_unreviewed_delivery_after_revise(self) -> None:
+        rng = random.Random(0)
+        for _ in range(200):
+            fn, _ = _agent(REVISE_OUTPUT)
+            ts = TrustScore("a", initial_score=50)
+            result = AgentPipeline(fn, ts, rng=rng).run("q?")
+            if result.iterations > 1:
+                assert result.review_result is not None
+
+    def test_fixed_rates_ignore_rng(self) -> None:
+        rng = _FixedRandom(0.5)
+        fn, _ = _agent(PASS_OUTPUT)
+        untrusted = AgentPipeline(fn, TrustScore("a", initial_score=0), rng=rng)
+        autonomous = AgentPipeline(fn, TrustScore("b", initial_score=90), rng=rng)
+
+        assert untrusted.run("q?").review_result is not None
+        assert autonomous.run("q?").review_result is None
+        assert rng.draws == 0
+
+
+# --- run_many ---
+
+class TestRunMany:
+    def test_results_in_input_order(self) -> None:
+        def fn(query: str) -> tuple[str, Beipackzettel]:
+            return f"answer to {query}", Beipackzettel(confidence=90)
+
+        ts = TrustScore("a", initial_score=90)
+        queries = [f"q{i}" for i in range(20)]
+        results = AgentPipeline(fn, ts).run_many(queries, max_workers=4)
+        assert [r.output for r in results] == [f"answer to {q}" for q in queries]
+
+    def test_one_trust_update_per_batch(self) -> None:
+        fn, calls = _agent(PASS_OUTPUT)
+        ts = _CountingTrustScore("a", initial_score=0)  # UNTRUSTED: every run reviewed
+        results = AgentPipeline(fn, ts).run_many(["q1", "q2", "q3"])
+
+        assert len(calls) == 3
+        assert all(r.delivered for r in results)
+        assert ts.update_many_calls == 1
+        assert ts.update_calls == 0
+        assert ts.score == 3
+        assert len(ts.history) == 3
+
+    def test_sampled_runs_review_every_iteration(self) -> None:
+        fn, _ = _agent(REVISE_OUTPUT)
+        ts = TrustScore("a", initial_score=50)
+        pipeline = AgentPipeline(fn, ts, rng=random.Random(0))
+        for result in pipeline.run_many(["q"] * 50, max_workers=4):
+            if result.iterations > 1:
+                assert result.review_result is not None
@@ -0,0 +1,57 @@
+"""Tests for the adversarial reviewer."""
+
+from agenttrust.qa.reviewer import review
+from agenttrust.qa.rubric import DIMENSIONS, Dimension
+
+
+def _constant_scorer(value: int):
+    """Score function returning ``value`` for every dimension, recording calls."""
+    calls: list[str] = []
+
+    def score_fn(output: str, dimension: Dimension) -> int:
+        calls.append(dimension.id)
+        return value
+
+    return score_fn, calls
+
+
+# --- early_exit ---
+
+class TestEarlyExit:
+    def test_verdict_matches_full_review(self) -> None:
+        for value, verdict in ((2, "PASS"), (0, "FAIL")):
+            full = review("output", score_fn=_constant_scorer(value)[0])
+            early = review("output", score_fn=_constant_scorer(value)[0], early_exit=True)
+            assert full.verdict == early.verdict == verdict
+
+    def test_verdict_matches_with_heuristic_scorer(self) -> None:
+        for output in ("Paris", "## Answer\n\nSource: https://x.org. I recommend it."):
+            for tier in (1, 2, 3):
+                full = review(output, tier=tier)
+                early = review(output, tier=tier, early_exit=True)
+                assert full.verdict == early.verdict
+
+    def test_skipped_dimensions_scored_zero_and_listed(self) -> None:
+        # Six dimensions at 2 reach the tier-2 pass mark of 12
+        result = review("output", score_fn=_constant_scorer(2)[0], early_exit=True)
+        skipped = DIMENSIONS[6:]
+        for dim in skipped:
+            assert result.rubric_score.scores[dim.id] == 0
+            assert f"{dim.name}: skipped — verdict decided" in result.issues
+        assert len(result.rubric_score.scores) == len(DIMENSIONS)
+
+    def test_score_fn_not_called_after_exit(self) -> None:
+        score_fn, calls = _constant_scorer(2)
+        review("output", score_fn=score_fn, early_exit=True)
+        assert calls == [d.id for d in DIMENSIONS[:6]]
+
+        # All zeros: after five dimensions even full marks can't reach REVISE (8)
+        score_fn, calls = _constant_scorer(0)
+        review("output", score_fn=score_fn, early_exit=True)
+        assert calls == [d.id for d in DIMENSIONS[:5]]
+
+    def test_disabled_by_default(self) -> None:
+        score_fn, calls = _constant_scorer(2)
+        result = review("output", score_fn=score_fn)
+        assert len(calls) == len(DIMENSIONS)
+        assert not any("skipped" in issue for issue in result.issues)
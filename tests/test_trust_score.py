@@ -0,0 +1,72 @@
+"""Tests for agent trust scores."""
+
+import pytest
+
+from agenttrust.core.trust_score import TrustLevel, TrustScore
+
+
+# --- update_many ---
+
+class TestUpdateMany:
+    def _replay(self, initial_score: int, pairs: list) -> tuple[TrustScore, TrustScore]:
+        one_by_one = TrustScore("seq", initial_score=initial_score)
+        for conf, outcome in pairs:
+            one_by_one.update(conf, outcome)
+        batched = TrustScore("batch", initial_score=initial_score)
+        batched.update_many(pairs)
+        return one_by_one, batched
+
+    def test_matches_sequential_updates(self) -> None:
+        pairs = [(85, "good"), (95, "bad"), (60, "flagged_real"), (50, "bad")]
+        one_by_one, batched = self._replay(40, pairs)
+        assert batched.score == one_by_one.score == 39
+        assert batched.trust_level == one_by_one.trust_level
+        assert [e.delta for e in batched.history] == [e.delta for e in one_by_one.history]
+        assert [e.reason for e in batched.history] == [e.reason for e in one_by_one.history]
+
+    def test_clamps_after_every_event(self) -> None:
+        # Clamped at 100 mid-batch, so the final bad lands at 97, not 99
+        pairs = [(85, "good"), (85, "good"), (60, "flagged_real"), (95, "bad")]
+        one_by_one, batched = self._replay(99, pairs)
+        assert batched.score == one_by_one.score == 97
+        assert batched.trust_level == one_by_one.trust_level == TrustLevel.AUTONOMOUS
+
+        # Clamped at 0 mid-batch on the way down
+        pairs = [(95, "bad"), (95, "bad"), (85, "good")]
+        one_by_one, batched = self._replay(2, pairs)
+        assert batched.score == one_by_one.score == 1
+        assert [e.delta for e in batched.history] == [-3, -3, 1]
+
+    def test_empty_batch_is_noop(self) -> None:
+        ts = TrustScore("a", initial_score=50)
+        assert ts.update_many([]) == []
+        assert ts.score == 50
+        assert ts.summary()["total_events"] == 0
+
+
+# --- history_limit ---
+
+class TestHistoryLimit:
+    def test_keeps_most_recent_events(self) -> None:
+        ts = TrustScore("a", history_limit=3)
+        for conf in (10, 20, 30, 40, 50):
+            ts.update(conf, "good")
+        assert [e.stated_confidence for e in ts.history] == [30, 40, 50]
+        assert ts.score == 5
+
+    def test_total_events_counts_dropped_events(self) -> None:
+        ts = TrustScore("a", history_limit=2)
+        ts.update_many([(85, "good")] * 4)
+        ts.update(85, "good")
+        assert len(ts.history) == 2
+        assert ts.summary()["total_events"] == 5
+
+    def test_none_keeps_everything(self) -> None:
+        ts = TrustScore("a", history_limit=None)
+        ts.update_many([(85, "good")] * 20)
+        assert len(ts.history) == 20
+
+    def test_rejects_limit_below_one(self) -> None:
+        for limit in (0, -1):
+            with pytest.raises(ValueError, match="history_limit"):
+                TrustScore("a", history_limit=limit)